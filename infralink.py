@@ -9,18 +9,18 @@ def extract_match_part(device_name):
     """Extract the relevant part of device name based on underscore rules"""
     if not isinstance(device_name, str):
         return str(device_name)
-    
-    parts = device_name.split('_')
-    
-    # If only one underscore, take everything after it
-    if len(parts) == 2:
-        return parts[1]
-    # If multiple underscores, take everything after the second-to-last underscore
-    elif len(parts) > 2:
-        return '_'.join(parts[-2:])
+
+    # rpartition instead of split: fixed 3-tuples, no variable-length list
+    head, sep, tail = device_name.rpartition('_')
     # If no underscores, use the full name
-    else:
+    if not sep:
         return device_name
+    head2, sep2, mid = head.rpartition('_')
+    # If only one underscore, take everything after it
+    if not sep2:
+        return tail
+    # If multiple underscores, take everything after the second-to-last underscore
+    return f"{mid}_{tail}"
 
 def normalize_link(source, destination):
     """Ensure consistent link representation (alphabetical order) with underscore processing"""
@@ -28,6 +28,47 @@ def normalize_link(source, destination):
     dst_match = extract_match_part(str(destination).strip())
     return tuple(sorted([src_match, dst_match]))
 
+def extract_match_part_series(s):
+    """Vectorized extract_match_part over a whole Series of device names"""
+    # Columns arrive stripped from canonicalize_columns. Categorical
+    # astype(str) keeps blanks as NA, so coerce them to 'nan' as the scalar
+    # path's str() does — this also keeps factorize from emitting -1 codes
+    s = s.astype(str).fillna('nan')
+    parts = s.str.split('_')
+    n_parts = parts.str.len()
+    out = s.copy()
+    # If only one underscore, take everything after it
+    out[n_parts == 2] = parts[n_parts == 2].str[1]
+    # If multiple underscores, take everything after the second-to-last underscore
+    out[n_parts > 2] = parts[n_parts > 2].str[-2:].str.join('_')
+    # No underscores: keep the full name
+    return out
+
+def normalize_link_series(source, destination):
+    """Vectorized normalize_link: one 'lo|hi' string per row (alphabetical order)"""
+    src_match = extract_match_part_series(source)
+    dst_match = extract_match_part_series(destination)
+    lo = np.minimum(src_match, dst_match)
+    hi = np.maximum(src_match, dst_match)
+    return lo + '|' + hi
+
+def factorize_links(*key_series):
+    """Map 'lo|hi' link keys to int64 codes shared across the given Series.
+
+    groupby/isin/drop_duplicates on int64 codes beat object-dtype strings;
+    the returned uniques array reconstructs the readable key for display.
+    sort=True assigns codes in lexicographic key order, so sorting by code
+    is the same as sorting by the readable key.
+    """
+    codes, uniques = pd.factorize(pd.concat(key_series, ignore_index=True), sort=True)
+    codes = codes.astype(np.int64)
+    out = []
+    start = 0
+    for s in key_series:
+        out.append(codes[start:start + len(s)])
+        start += len(s)
+    return out, uniques
+
 def canonicalize_columns(df):
     """Standardize column names for Source/Destination and their ports"""
     rename_map = {}
@@ -44,65 +85,89 @@ def canonicalize_columns(df):
             rename_map[c] = 'Destination Port'
     df = df.rename(columns=rename_map)
     df.rename(columns=lambda x: x.strip(), inplace=True)
+    # Arrow-backed strings: every .str operation below dispatches to C++
+    # kernels instead of per-element Python calls, at about half the memory.
+    # Invariant: the four key columns leave here already whitespace-stripped,
+    # so downstream code never needs another .astype(str).str.strip() pass.
+    # The final categorical cast stores each device/port name once and turns
+    # groupby/sort keys into small integer codes (groupbys on these columns
+    # must pass observed=True to stay linear in the observed combinations).
+    for c in ('Source', 'Destination', 'Source Port', 'Destination Port'):
+        if c in df.columns:
+            try:
+                stripped = df[c].astype('string[pyarrow]').str.strip()
+            except ImportError:  # pyarrow not installed; object dtype still works
+                stripped = df[c].astype(str).str.strip()
+            df[c] = stripped.astype('category')
     return df
 
-def get_preferred_ports(df, source, destination):
-    """Get ports with priority for Eth- and ae- prefixes (case-insensitive)"""
-    filtered = df[(df['Source'] == source) & (df['Destination'] == destination)]
-    if filtered.empty:
-        filtered = df[(df['Source'] == destination) & (df['Destination'] == source)]
-    if filtered.empty:
-        return None, None
-
-    # First preference: Eth ports
-    eth_source = filtered[filtered['Source Port'].astype(str).str.lower().str.startswith('eth')]
-    eth_dest = filtered[filtered['Destination Port'].astype(str).str.lower().str.startswith('eth')]
-    
-    # Second preference: AE ports
-    if eth_source.empty:
-        eth_source = filtered[filtered['Source Port'].astype(str).str.lower().str.startswith('ae')]
-    if eth_dest.empty:
-        eth_dest = filtered[filtered['Destination Port'].astype(str).str.lower().str.startswith('ae')]
-    
-    source_port = eth_source['Source Port'].iloc[0] if not eth_source.empty else filtered['Source Port'].iloc[0]
-    dest_port = eth_dest['Destination Port'].iloc[0] if not eth_dest.empty else filtered['Destination Port'].iloc[0]
-    
-    return source_port, dest_port
-
-def port_priority_score(port):
-    """Assign priority score to ports (higher is better)"""
-    if pd.isna(port):
-        return 0
-    port_str = str(port).lower()
-    if port_str.startswith('eth'):
-        return 3
-    elif port_str.startswith('ae'):
-        return 2
-    else:
-        return 1
+def link_direction_reversed(source, destination):
+    """True where a row is stored opposite to the canonical lo/hi link direction"""
+    src_match = extract_match_part_series(source)
+    dst_match = extract_match_part_series(destination)
+    return (src_match > dst_match).fillna(False).to_numpy(bool)
+
+def build_preferred_ports(df, rev=None, src_port_lc=None, dst_port_lc=None):
+    """Build a Normalized-indexed table of preferred ports (Eth > AE > other).
+
+    Rows stored opposite to the canonical lo/hi direction contribute their
+    ports swapped, so a reversed row's far-end port never leaks into the
+    wrong side. The best source and best destination port are then picked
+    independently per link, as get_preferred_ports used to. The returned
+    ports are in the canonical direction; swap them back per row with `rev`
+    when reporting. Callers that already hold the direction mask or
+    lowercased port columns can pass them in to avoid recomputing.
+    """
+    if rev is None:
+        rev = link_direction_reversed(df['Source'], df['Destination'])
+    src_pri = port_priority_vec(df['Source Port'], low=src_port_lc)
+    dst_pri = port_priority_vec(df['Destination Port'], low=dst_port_lc)
+    oriented = pd.DataFrame({
+        'Normalized': df['Normalized'].to_numpy(),
+        'Source Port': np.where(rev, df['Destination Port'], df['Source Port']),
+        'Destination Port': np.where(rev, df['Source Port'], df['Destination Port']),
+        'Source Priority': np.where(rev, dst_pri, src_pri),
+        'Dest Priority': np.where(rev, src_pri, dst_pri),
+    })
+    grouped = oriented.groupby('Normalized')
+    best_src = oriented.loc[grouped['Source Priority'].idxmax()].set_index('Normalized')['Source Port']
+    best_dst = oriented.loc[grouped['Dest Priority'].idxmax()].set_index('Normalized')['Destination Port']
+    return pd.DataFrame({'Source Port': best_src, 'Destination Port': best_dst})
+
+def port_priority_vec(ports, low=None):
+    """Assign priority scores to a whole Series of ports (higher is better).
+
+    `low` takes an already-lowercased version of `ports` to skip re-lowercasing.
+    """
+    if low is None:
+        low = ports.astype(str).str.lower()
+    # Categorical astype(str) keeps missing values as NA, so the startswith
+    # masks must be filled before np.select will accept them
+    is_eth = low.str.startswith('eth').fillna(False).to_numpy(bool)
+    is_ae = low.str.startswith('ae').fillna(False).to_numpy(bool)
+    scores = np.select([is_eth, is_ae], [3, 2], default=1).astype(np.int8)
+    scores[ports.isna().to_numpy()] = 0
+    return scores
 
 def find_duplicate_ports(df):
-    """Return only rows with duplicate Source+Port or Dest+Port"""
+    """Return only rows where a Source+Port or Destination+Port pair repeats"""
     df = df.copy()
-    df['Source+Port'] = df['Source'].astype(str).str.strip() + "_" + df['Source Port'].astype(str).str.strip()
-    df['Dest+Port'] = df['Destination'].astype(str).str.strip() + "_" + df['Destination Port'].astype(str).str.strip()
-
-    source_counts = df['Source+Port'].value_counts()
-    dest_counts = df['Dest+Port'].value_counts()
-
-    df['Source Port Duplicate'] = df['Source+Port'].map(source_counts) > 1
-    df['Destination Port Duplicate'] = df['Dest+Port'].map(dest_counts) > 1
-
+    # dropna=False keeps blank-port rows in the count, as the old
+    # stringified Source+Port keys did
+    df['Source Port Duplicate'] = df.groupby(['Source', 'Source Port'], observed=True, dropna=False)['Source'].transform('size').gt(1)
+    df['Destination Port Duplicate'] = df.groupby(['Destination', 'Destination Port'], observed=True, dropna=False)['Destination'].transform('size').gt(1)
     return df[df['Source Port Duplicate'] | df['Destination Port Duplicate']]
 
 def remove_duplicate_links_with_priority(df):
     """Remove duplicates with priority for Eth/AE ports"""
     df = df.copy()
-    df['Normalized'] = df.apply(lambda x: normalize_link(x['Source'], x['Destination']), axis=1)
-    
-    # Calculate priority score for each row
-    df['Source Priority'] = df['Source Port'].apply(port_priority_score)
-    df['Dest Priority'] = df['Destination Port'].apply(port_priority_score)
+    # Reuse a Normalized column the caller already computed, if any
+    if 'Normalized' not in df.columns:
+        (df['Normalized'],), _ = factorize_links(normalize_link_series(df['Source'], df['Destination']))
+
+    # Calculate priority score for each row (int8 keeps the intermediates small)
+    df['Source Priority'] = port_priority_vec(df['Source Port'])
+    df['Dest Priority'] = port_priority_vec(df['Destination Port'])
     df['Total Priority'] = df['Source Priority'] + df['Dest Priority']
     
     # Keep the row with highest priority for each normalized link
@@ -116,21 +181,37 @@ def remove_duplicate_links_with_priority(df):
     
     return cleaned, duplicates
 
+@st.cache_data(show_spinner=False)
 def df_to_csv_download(df):
-    return df.to_csv(index=False).encode('utf-8')
+    """Encode CSV straight into a bytes buffer; repeated button reruns hit the cache"""
+    buf = BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False)
+def _parse_excel_bytes(data):
+    """Parse Excel bytes once; identical content hits the cache on later reruns"""
+    try:
+        # Rust-based reader, much faster than openpyxl; the pyarrow backend
+        # gives nullable dtypes without a separate convert_dtypes() pass
+        return pd.read_excel(BytesIO(data), engine='calamine', dtype_backend='pyarrow')
+    except ImportError:
+        # No convert_dtypes() here: nothing downstream relies on nullable
+        # dtypes, and the inference pass would just re-copy every column
+        return pd.read_excel(BytesIO(data))
 
 def read_excel_any(source):
     """Read Excel from an UploadedFile or from raw bytes stored in session_state"""
     if source is None:
         return None
     if isinstance(source, bytes):
-        return pd.read_excel(BytesIO(source)).convert_dtypes()
-    # UploadedFile or file-like
+        return _parse_excel_bytes(source)
+    # UploadedFile or file-like: reduce to bytes so the cache can key on content
     try:
         source.seek(0)  # in case it was read before
     except Exception:
         pass
-    return pd.read_excel(source).convert_dtypes()
+    return _parse_excel_bytes(source.read())
 
 # ---------- Streamlit UI ----------
 st.title("Network Link Manager")
@@ -218,17 +299,20 @@ with tab_main:
     with col2:
         match_db = st.file_uploader("Phoenix Database", type=['xlsx', 'xls'], key="match_db")
 
-    # Persist Phoenix DB (as bytes) for other tabs to reuse automatically
+    # Persist the parsed Phoenix DB for other tabs to reuse automatically
+    # (bytes kept alongside as a compatibility fallback)
     if match_db:
         try:
             st.session_state["phoenix_db_bytes"] = match_db.getvalue()
-            st.caption("Phoenix DB stored for other tabs.")
         except Exception:
             # Fallback: read then re-save as bytes
             match_db.seek(0)
-            b = match_db.read()
-            st.session_state["phoenix_db_bytes"] = b
-            st.caption("Phoenix DB stored for other tabs.")
+            st.session_state["phoenix_db_bytes"] = match_db.read()
+        try:
+            st.session_state["phoenix_df"] = canonicalize_columns(read_excel_any(match_db))
+        except Exception:
+            st.session_state.pop("phoenix_df", None)
+        st.caption("Phoenix DB stored for other tabs.")
 
     if main_db and match_db:
         try:
@@ -242,97 +326,113 @@ with tab_main:
                     st.error(f"{name} missing columns: {', '.join(missing)}")
                     st.stop()
 
-            # Sort links
-            main_df['Normalized'] = main_df.apply(lambda x: normalize_link(x['Source'], x['Destination']), axis=1)
-            match_df['Normalized'] = match_df.apply(lambda x: normalize_link(x['Source'], x['Destination']), axis=1)
+            # Sort links: factorize both frames together so the int64 codes
+            # agree between Main and Phoenix
+            (main_codes, match_codes), link_names = factorize_links(
+                normalize_link_series(main_df['Source'], main_df['Destination']),
+                normalize_link_series(match_df['Source'], match_df['Destination']))
+            main_df['Normalized'] = main_codes
+            match_df['Normalized'] = match_codes
             main_df = main_df.sort_values(by=['Normalized']).reset_index(drop=True)
             match_df = match_df.sort_values(by=['Normalized']).reset_index(drop=True)
 
-            all_links = set(main_df['Normalized'])
             match_links = set(match_df['Normalized'])
 
-            analysis_results = []
-            missing_results = []
-            port_corrections = []
-
-            # NEW PORT CORRECTION LOGIC: Find all port inconsistencies
-            # Group the main_df by normalized link to find groups with multiple entries
-            link_groups = main_df.groupby('Normalized')
-            for norm_link, group in link_groups:
-                # Check if this link has multiple rows (implying potential port inconsistencies)
-                if len(group) > 1:
-                    # Get all unique ports for this link
-                    unique_src_ports = group['Source Port'].astype(str).str.strip().unique()
-                    unique_dst_ports = group['Destination Port'].astype(str).str.strip().unique()
-                    
-                    # Find the preferred ports for this link (Eth/ae priority)
-                    sample_row = group.iloc[0]
-                    src, dst = sample_row['Source'], sample_row['Destination']
-                    corr_src_port, corr_dst_port = get_preferred_ports(main_df, src, dst)
-                    
-                    # For each row in the group, check if its ports match the corrected ones
-                    for _, row in group.iterrows():
-                        orig_src = str(row['Source Port']).strip()
-                        orig_dst = str(row['Destination Port']).strip()
-                        corr_src = str(corr_src_port).strip() if corr_src_port else 'N/A'
-                        corr_dst = str(corr_dst_port).strip() if corr_dst_port else 'N/A'
-                        
-                        if orig_src != corr_src or orig_dst != corr_dst:
-                            port_corrections.append({
-                                'Link Name': f"{src} to {dst}",
-                                'Source': src,
-                                'Original Source Port': orig_src,
-                                'Corrected Source Port': corr_src,
-                                'Destination': dst,
-                                'Original Destination Port': orig_dst,
-                                'Corrected Destination Port': corr_dst,
-                                'Port Priority Applied': (
-                                    corr_src.lower().startswith(('eth', 'ae')) or
-                                    corr_dst.lower().startswith(('eth', 'ae'))
-                                ),
-                                'Issue': 'Port Mismatch'
-                            })
-
-            # Continue with the original analysis for missing links
-            for norm_link in all_links:
-                # Find all rows in main_df that match this normalized link
-                main_subset = main_df[main_df['Normalized'] == norm_link]
-                if main_subset.empty:
-                    continue
-                    
-                # Get the original source and destination from the first row
-                original = main_subset.iloc[0]
-                src, dst = original['Source'], original['Destination']
-                
-                # Check if this normalized link exists in the match database
-                exists = norm_link in match_links
-                
-                # Get the preferred ports for this link
-                corr_src_port, corr_dst_port = get_preferred_ports(main_df, src, dst)
-
-                analysis_results.append({
-                    'Link Name': f"{src} to {dst}",
-                    'Source': src,
-                    'Original Source Port': original['Source Port'],
-                    'Destination': dst,
-                    'Original Destination Port': original['Destination Port'],
-                    'Match Status': 'Found' if exists else 'Missing',
-                    'Normalized Link': str(norm_link)  # For debugging
-                })
-
-                if not exists:
-                    missing_results.append({
-                        'Link Name': f"{src} to {dst}",
-                        'Source': src,
-                        'Corrected Source Port': corr_src_port,
-                        'Destination': dst,
-                        'Corrected Destination Port': corr_dst_port,
-                        'Normalized Link': str(norm_link)  # For debugging
-                    })
-
-            analysis_df = pd.DataFrame(analysis_results)
-            missing_df = pd.DataFrame(missing_results)
-            ports_df = pd.DataFrame(port_corrections)
+            # Lowercase the port columns once; the prefix checks reuse these.
+            # Blank ports survive astype(str) as NA on categoricals, so fill
+            # them here (port_priority_vec still scores missing ports as 0)
+            src_port_lc = main_df['Source Port'].astype(str).str.lower().fillna('')
+            dst_port_lc = main_df['Destination Port'].astype(str).str.lower().fillna('')
+
+            # Which rows are stored opposite to the canonical lo/hi direction;
+            # computed once and reused to orient the preferred ports per row
+            main_df['_rev'] = link_direction_reversed(main_df['Source'], main_df['Destination'])
+
+            # Precompute the preferred ports per link once instead of scanning
+            # main_df for every link inside the loops below
+            preferred_ports = build_preferred_ports(
+                main_df, rev=main_df['_rev'].to_numpy(),
+                src_port_lc=src_port_lc, dst_port_lc=dst_port_lc)
+
+            # NEW PORT CORRECTION LOGIC: Find all port inconsistencies.
+            # Join every row against the preferred ports for its link, then a
+            # single boolean mask picks the mismatching rows on multi-row links
+            joined = main_df.join(
+                preferred_ports.rename(columns={
+                    'Source Port': 'Corrected Source Port',
+                    'Destination Port': 'Corrected Destination Port'}),
+                on='Normalized')
+            # Ports are already stripped by canonicalize_columns. On the
+            # categorical columns astype(str) keeps blanks as NA, so fill
+            # them before comparing or the mismatch mask would contain NA
+            orig_src = joined['Source Port'].astype(str).fillna('')
+            orig_dst = joined['Destination Port'].astype(str).fillna('')
+            corr_src_canon = joined['Corrected Source Port'].astype(str).fillna('')
+            corr_dst_canon = joined['Corrected Destination Port'].astype(str).fillna('')
+            # The preferred pair is in the canonical direction; reversed rows
+            # compare (and report) against the opposite side of that pair
+            rev_rows = joined['_rev'].to_numpy()
+            corr_src = corr_src_canon.where(~rev_rows, corr_dst_canon)
+            corr_dst = corr_dst_canon.where(~rev_rows, corr_src_canon)
+            mismatch = (
+                ((orig_src != corr_src) | (orig_dst != corr_dst)) &
+                (joined.groupby('Normalized')['Source'].transform('size') > 1)
+            )
+            corrections = joined[mismatch]
+
+            # Continue with the original analysis for missing links:
+            # one representative row per link, then a vectorized membership
+            # test against the match DB instead of a per-link column scan
+            reps = main_df.drop_duplicates(subset=['Normalized'], keep='first').set_index('Normalized')
+            reps['Link Name'] = reps['Source'].astype(str) + ' to ' + reps['Destination'].astype(str)
+            reps['Match Status'] = np.where(reps.index.isin(match_links), 'Found', 'Missing')
+
+            analysis_df = (
+                reps.reset_index()
+                .rename(columns={'Source Port': 'Original Source Port',
+                                 'Destination Port': 'Original Destination Port',
+                                 'Normalized': 'Normalized Link'})  # For debugging
+                [['Link Name', 'Source', 'Original Source Port', 'Destination',
+                  'Original Destination Port', 'Match Status', 'Normalized Link']]
+            )
+            # Map the int64 codes back to the readable 'lo|hi' keys for display
+            analysis_df['Normalized Link'] = link_names[analysis_df['Normalized Link']]
+
+            # Missing links get their corrected ports from the precomputed table
+            missing = (
+                reps[reps['Match Status'] == 'Missing']
+                .join(preferred_ports.rename(columns={
+                    'Source Port': 'Corrected Source Port',
+                    'Destination Port': 'Corrected Destination Port'}))
+            )
+            # Report the corrected ports in each representative row's direction
+            rev_missing = missing['_rev'].to_numpy()
+            corrected_src = missing['Corrected Source Port'].where(
+                ~rev_missing, missing['Corrected Destination Port'])
+            missing['Corrected Destination Port'] = missing['Corrected Destination Port'].where(
+                ~rev_missing, missing['Corrected Source Port'])
+            missing['Corrected Source Port'] = corrected_src
+            missing_df = (
+                missing.reset_index()
+                .rename(columns={'Normalized': 'Normalized Link'})  # For debugging
+                [['Link Name', 'Source', 'Corrected Source Port', 'Destination',
+                  'Corrected Destination Port', 'Normalized Link']]
+            )
+            missing_df['Normalized Link'] = link_names[missing_df['Normalized Link']]
+            ports_df = pd.DataFrame({
+                'Link Name': corrections['Source'].astype(str) + ' to ' + corrections['Destination'].astype(str),
+                'Source': corrections['Source'],
+                'Original Source Port': orig_src[mismatch],
+                'Corrected Source Port': corr_src[mismatch],
+                'Destination': corrections['Destination'],
+                'Original Destination Port': orig_dst[mismatch],
+                'Corrected Destination Port': corr_dst[mismatch],
+                'Port Priority Applied': (
+                    corr_src[mismatch].str.lower().str.startswith(('eth', 'ae')) |
+                    corr_dst[mismatch].str.lower().str.startswith(('eth', 'ae'))
+                ),
+                'Issue': 'Port Mismatch'
+            }).reset_index(drop=True)
 
             st.success(f"Total links: {len(analysis_df)}, Missing: {len(missing_df)}, Port Corrections Needed: {len(ports_df)}")
 
@@ -361,17 +461,21 @@ with tab_main:
 with tab_dup_ports:
     st.subheader("Find Duplicate Ports in Phoenix DB")
     
-    # Prefer Phoenix DB saved from Panel 1; else allow manual upload
+    # Prefer the Phoenix DataFrame parsed in Panel 1; else allow manual upload
+    phoenix_df = st.session_state.get("phoenix_df", None)
     phoenix_bytes = st.session_state.get("phoenix_db_bytes", None)
     match_db_dup = None
-    if not phoenix_bytes:
+    if phoenix_df is None and not phoenix_bytes:
         match_db_dup = st.file_uploader("Upload Phoenix Database (Excel)", type=['xlsx', 'xls'], key="match_db_dup")
 
-    if phoenix_bytes or match_db_dup:
+    if phoenix_df is not None or phoenix_bytes or match_db_dup:
         try:
-            source = phoenix_bytes if phoenix_bytes else match_db_dup
-            match_df = canonicalize_columns(read_excel_any(source))
-            
+            if phoenix_df is not None:
+                match_df = phoenix_df
+            else:
+                source = phoenix_bytes if phoenix_bytes else match_db_dup
+                match_df = canonicalize_columns(read_excel_any(source))
+
             # Check required columns
             required_cols = ['Source', 'Source Port', 'Destination', 'Destination Port']
             missing = [c for c in required_cols if c not in match_df.columns]
@@ -389,7 +493,7 @@ with tab_dup_ports:
                     # Download button at the top for easy access
                     st.download_button(
                         "⬇️ Download Duplicate Ports CSV", 
-                        df_to_csv_download(dup_df.drop(columns=['Source+Port', 'Dest+Port'], errors='ignore')), 
+                        df_to_csv_download(dup_df),
                         "duplicate_ports.csv", 
                         "text/csv",
                         key="dup_ports_download"
@@ -402,55 +506,45 @@ with tab_dup_ports:
                         st.subheader("Source Port Duplicates")
                         source_dups = dup_df[dup_df['Source Port Duplicate']]
                         if not source_dups.empty:
-                            # Group by device and port
-                            for (device, port), group in source_dups.groupby(['Source', 'Source Port']):
-                                st.markdown(f"""
-                                #### 🚨 Duplicate Source Port
-                                
-                              
-                                **Device:** `{device}`  
-                                **Port:** `{port}`
-                                """)
-                                
-                                st.markdown(f"**Used in {len(group)} links as SOURCE port:**")
-                                for _, row in group.iterrows():
-                                    st.markdown(f"""
-                                    - → `{row['Destination']}`  
-                                      **Destination Port:** `{row['Destination Port']}`  
-                                      **Link ID:** `{row.get('Link ID', 'N/A')}`
-                                    """)
-                                st.markdown("---")
+                            # One aggregated table per device+port instead of a
+                            # markdown widget per duplicate row
+                            source_pivot = (
+                                source_dups.groupby(['Source', 'Source Port'], observed=True, dropna=False)
+                                .agg(**{
+                                    'Links': ('Destination', 'size'),
+                                    'Destinations': ('Destination', lambda x: ', '.join(x.astype(str).fillna('N/A'))),
+                                    'Destination Ports': ('Destination Port', lambda x: ', '.join(x.astype(str).fillna('N/A'))),
+                                })
+                                .reset_index()
+                            )
+                            st.dataframe(source_pivot, use_container_width=True)
+                            with st.expander("View Individual Source Duplicate Rows"):
+                                st.dataframe(source_dups, use_container_width=True)
                         else:
                             st.info("No source port duplicates found")
-                    
+
                     with tab_dest:
                         st.subheader("Destination Port Duplicates")
                         dest_dups = dup_df[dup_df['Destination Port Duplicate']]
                         if not dest_dups.empty:
-                            # Group by device and port
-                            for (device, port), group in dest_dups.groupby(['Destination', 'Destination Port']):
-                                st.markdown(f"""
-                                #### 🚨 Duplicate Destination Port
-                                
-                                **Link Name:** Multiple Devices to {device}  
-                                **Device:** `{device}`  
-                                **Port:** `{port}`
-                                """)
-                                
-                                st.markdown(f"**Used in {len(group)} links as DESTINATION port:**")
-                                for _, row in group.iterrows():
-                                    st.markdown(f"""
-                                    - ← `{row['Source']}`  
-                                      **Source Port:** `{row['Source Port']}`  
-                                      **Link ID:** `{row.get('Link ID', 'N/A')}`
-                                    """)
-                                st.markdown("---")
+                            dest_pivot = (
+                                dest_dups.groupby(['Destination', 'Destination Port'], observed=True, dropna=False)
+                                .agg(**{
+                                    'Links': ('Source', 'size'),
+                                    'Sources': ('Source', lambda x: ', '.join(x.astype(str).fillna('N/A'))),
+                                    'Source Ports': ('Source Port', lambda x: ', '.join(x.astype(str).fillna('N/A'))),
+                                })
+                                .reset_index()
+                            )
+                            st.dataframe(dest_pivot, use_container_width=True)
+                            with st.expander("View Individual Destination Duplicate Rows"):
+                                st.dataframe(dest_dups, use_container_width=True)
                         else:
                             st.info("No destination port duplicates found")
                     
                     # Show full table in expander
                     with st.expander("View All Duplicates in Table Format"):
-                        st.dataframe(dup_df.drop(columns=['Source+Port', 'Dest+Port'], errors='ignore'))
+                        st.dataframe(dup_df)
                         
         except Exception as e:
             st.error(f"Error processing file: {str(e)}")
@@ -461,16 +555,21 @@ with tab_dup_ports:
 with tab_remove_dup:
     st.subheader("Remove Directional Duplicate Links (Phoenix DB)")
 
-    # Prefer Phoenix DB saved from Panel 1; else allow manual upload
+    # Prefer the Phoenix DataFrame parsed in Panel 1; else allow manual upload
+    phoenix_df = st.session_state.get("phoenix_df", None)
     phoenix_bytes = st.session_state.get("phoenix_db_bytes", None)
     file_remove_dup = None
-    if not phoenix_bytes:
+    if phoenix_df is None and not phoenix_bytes:
         file_remove_dup = st.file_uploader("Upload Phoenix Database (Excel)", type=['xlsx', 'xls'], key="file_remove_dup")
 
-    if phoenix_bytes or file_remove_dup:
+    if phoenix_df is not None or phoenix_bytes or file_remove_dup:
         try:
-            source = phoenix_bytes if phoenix_bytes else file_remove_dup
-            df = canonicalize_columns(read_excel_any(source))
+            if phoenix_df is not None:
+                # Copy so the columns added below don't leak into the shared frame
+                df = phoenix_df.copy()
+            else:
+                source = phoenix_bytes if phoenix_bytes else file_remove_dup
+                df = canonicalize_columns(read_excel_any(source))
             required_cols = ['Source', 'Destination', 'Source Port', 'Destination Port']
             missing = [c for c in required_cols if c not in df.columns]
             if missing:
@@ -480,11 +579,13 @@ with tab_remove_dup:
                 if 'Link ID' not in df.columns:
                     df['Link ID'] = "Row " + (df.index + 1).astype(str)
                 
+                # Normalize once; the duplicate removal below reuses this column
+                (df['Normalized'],), _ = factorize_links(normalize_link_series(df['Source'], df['Destination']))
+
                 # Remove duplicates with port priority
                 cleaned_df, duplicates_df = remove_duplicate_links_with_priority(df)
-                
+
                 # Identify which would be kept during cleaning (first occurrence)
-                df['Normalized'] = df.apply(lambda x: normalize_link(x['Source'], x['Destination']), axis=1)
                 df['Is_Kept'] = ~df.duplicated(subset=['Normalized'], keep='first')
                 
                 # Prepare duplicate report showing ALL duplicates with keep marker
@@ -493,42 +594,36 @@ with tab_remove_dup:
                     subset=['Normalized'], keep='first'
                 ).map({True: "Duplicate (would be removed)", False: "Original (would be kept)"})
                 
-                # Group duplicates for summary view
-                grouped_duplicates = all_duplicates.groupby('Normalized').agg({
-                    'Source': 'first',
-                    'Destination': 'first',
-                    'Source Port': 'first',
-                    'Destination Port': 'first',
-                    'Link ID': lambda x: list(x),
-                    'Keep Status': 'count'
-                }).reset_index()
-                
-                # Create a clean summary table for display
-                summary_data = []
-                for _, row in grouped_duplicates.iterrows():
-                    # Get all link IDs for this connection
-                    all_link_ids = row['Link ID']
-                    
-                    # Determine which ones would be kept (highest priority)
-                    link_rows = all_duplicates[all_duplicates['Normalized'] == row['Normalized']]
-                    kept_row = link_rows[link_rows['Keep Status'] == "Original (would be kept)"].iloc[0]
-                    kept_link_id = kept_row['Link ID']
-                    
-                    # Link IDs to be removed (all except the kept one)
-                    to_be_removed = [lid for lid in all_link_ids if lid != kept_link_id]
-                    
-                    # Use "to" instead of arrow symbol in link name
-                    summary_data.append({
-                        'Link Name': f"{row['Source']} to {row['Destination']}",
-                        'Link IDs': ', '.join(map(str, all_link_ids)),
-                        'Source': row['Source'],
-                        'Source Port': row['Source Port'],
-                        'Destination': row['Destination'],
-                        'Destination Port': row['Destination Port'],
-                        'To Be Removed': ', '.join(map(str, to_be_removed)) if to_be_removed else 'None'
-                    })
-                
-                summary_df = pd.DataFrame(summary_data)
+                # Group duplicates for summary view in one vectorized pass:
+                # aggregate per link, then map in the kept Link ID per group
+                # instead of re-scanning all_duplicates for every group
+                grouped_duplicates = all_duplicates.groupby('Normalized').agg(**{
+                    'Source': ('Source', 'first'),
+                    'Source Port': ('Source Port', 'first'),
+                    'Destination': ('Destination', 'first'),
+                    'Destination Port': ('Destination Port', 'first'),
+                    'Link ID': ('Link ID', list),
+                })
+                kept_ids = (
+                    all_duplicates[all_duplicates['Keep Status'] == "Original (would be kept)"]
+                    .drop_duplicates(subset=['Normalized'])
+                    .set_index('Normalized')['Link ID']
+                )
+                grouped_duplicates['Kept ID'] = kept_ids
+
+                # Use "to" instead of arrow symbol in link name
+                summary_df = pd.DataFrame({
+                    'Link Name': grouped_duplicates['Source'].astype(str) + ' to ' + grouped_duplicates['Destination'].astype(str),
+                    'Link IDs': grouped_duplicates['Link ID'].map(lambda ids: ', '.join(map(str, ids))),
+                    'Source': grouped_duplicates['Source'],
+                    'Source Port': grouped_duplicates['Source Port'],
+                    'Destination': grouped_duplicates['Destination'],
+                    'Destination Port': grouped_duplicates['Destination Port'],
+                    'To Be Removed': [
+                        ', '.join(str(lid) for lid in ids if lid != kept) or 'None'
+                        for ids, kept in zip(grouped_duplicates['Link ID'], grouped_duplicates['Kept ID'])
+                    ],
+                }).reset_index(drop=True)
 
                 st.write(f"Original rows: {len(df)}, Unique links: {len(cleaned_df)}, Duplicate groups: {len(summary_df)}")
 